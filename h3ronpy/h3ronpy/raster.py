@@ -8,37 +8,116 @@ Resolution search modes
 * "smaller_than_pixel":  chose the h3 resolution where the area of the h3index is smaller than the area of a pixel.
 """
 
+from functools import lru_cache
+
 import geopandas as gp
-import h3.api.numpy_int as h3
 import numpy as np
-from shapely.geometry import Polygon
 
 import pandas as pd
 from .h3ronpy import raster
-from .util import _array_nditer
+from .util import _h3indexes_to_polygons
 from . import H3_CRS
 
 try:
     # affine library is used by rasterio
     import affine
 
-    __HAS_AFFINE_LIB = True
+    _HAS_AFFINE_LIB = True
 except ImportError:
-    __HAS_AFFINE_LIB = False
+    _HAS_AFFINE_LIB = False
 
 
 def _get_transform(t):
     if isinstance(t, raster.Transform):
         return t
-    if __HAS_AFFINE_LIB:
+    if isinstance(t, list):
+        # lists are not hashable, but their conversion result can be cached
+        # when they are converted to tuples
+        t = tuple(t)
+    try:
+        return _convert_transform(t)
+    except TypeError:
+        # unhashable input the lru_cache can not handle
+        raise ValueError("unsupported object for transform")
+
+
+@lru_cache(maxsize=16)
+def _convert_transform(t):
+    """
+    convert a hashable transform object to a raster.Transform instance
+
+    The same transform is typically used for many conversions, so the
+    results are cached.
+    """
+    if _HAS_AFFINE_LIB:
         if isinstance(t, affine.Affine):
             return raster.Transform.from_rasterio([t.a, t.b, t.c, t.d, t.e, t.f])
-    if type(t) in (list, tuple) and len(t) == 6:
+    if type(t) is tuple and len(t) == 6:
         # probably native gdal
         return raster.Transform.from_gdal(t)
     raise ValueError("unsupported object for transform")
 
 
+# narrower dtypes to try when shrinking integer rasters, in order of preference
+_SHRINK_DTYPE_CANDIDATES = (
+    np.dtype(np.uint8), np.dtype(np.int8),
+    np.dtype(np.uint16), np.dtype(np.int16),
+    np.dtype(np.uint32), np.dtype(np.int32),
+)
+
+
+def _shrink_integer_raster(in_raster, nodata_value):
+    """
+    cast an integer raster to the narrowest dtype able to hold its value range
+
+    Rasters with few value classes are often stored in a much wider dtype than
+    needed. A narrower dtype reduces the memory bandwidth and hashing work of
+    the conversion.
+
+    :return: (raster, nodata_value)-tuple, possibly casted
+    """
+    if in_raster.dtype.kind not in ("i", "u") or in_raster.dtype.itemsize <= 1 or in_raster.size == 0:
+        return in_raster, nodata_value
+    in_min = in_raster.min()
+    in_max = in_raster.max()
+    if nodata_value is not None:
+        # the nodata value must stay representable, even when it does not
+        # occur in the raster
+        in_min = min(in_min, nodata_value)
+        in_max = max(in_max, nodata_value)
+    for candidate in _SHRINK_DTYPE_CANDIDATES:
+        if candidate.itemsize >= in_raster.dtype.itemsize:
+            continue
+        iinfo = np.iinfo(candidate)
+        if in_min >= iinfo.min and in_max <= iinfo.max:
+            if nodata_value is not None:
+                candidate_nodata = candidate.type(nodata_value)
+                if candidate_nodata != nodata_value:
+                    # the cast would change the nodata value - non-integral
+                    # floats as rasterio returns them, for example. shrinking
+                    # must never change which pixels count as nodata.
+                    break
+                nodata_value = candidate_nodata
+            return in_raster.astype(candidate), nodata_value
+    return in_raster, nodata_value
+
+
+# mapping of the input dtype - keyed by its kind and itemsize - to the
+# specialized conversion function to use
+_RASTER_TO_H3_FUNCS = {
+    ("u", 1): raster.raster_to_h3_u8,
+    ("i", 1): raster.raster_to_h3_i8,
+    ("u", 2): raster.raster_to_h3_u16,
+    ("i", 2): raster.raster_to_h3_i16,
+    ("u", 4): raster.raster_to_h3_u32,
+    ("i", 4): raster.raster_to_h3_i32,
+    ("u", 8): raster.raster_to_h3_u64,
+    ("i", 8): raster.raster_to_h3_i64,
+    ("f", 4): raster.raster_to_h3_f32,
+    ("f", 8): raster.raster_to_h3_f64,
+}
+
+
 def nearest_h3_resolution(shape, transform, axis_order="yx", search_mode="min_diff"):
     """
     find the h3 resolution closed to the size of a pixel in an array
@@ -72,37 +151,24 @@ def raster_to_dataframe(in_raster: np.array, transform, h3_resolution: int, noda
     :return: pandas dataframe or geodataframe
     """
 
-    dtype = in_raster.dtype
-    func = None
-    if dtype == np.uint8:
-        func = raster.raster_to_h3_u8
-    elif dtype == np.int8:
-        func = raster.raster_to_h3_i8
-    elif dtype == np.uint16:
-        func = raster.raster_to_h3_u16
-    elif dtype == np.int16:
-        func = raster.raster_to_h3_i16
-    elif dtype == np.uint32:
-        func = raster.raster_to_h3_u32
-    elif dtype == np.int32:
-        func = raster.raster_to_h3_i32
-    elif dtype == np.uint64:
-        func = raster.raster_to_h3_u64
-    elif dtype == np.int64:
-        func = raster.raster_to_h3_i64
-    elif dtype == np.float32:
-        func = raster.raster_to_h3_f32
-    elif dtype == np.float64:
-        func = raster.raster_to_h3_f64
-    else:
-        raise NotImplementedError(f"no raster_to_h3 implementation for dtype {dtype.name}")
+    # a no-op for already contiguous arrays, keeps the rust extension off the
+    # slow strided-access paths
+    in_raster = np.ascontiguousarray(in_raster)
+    value_dtype = in_raster.dtype
+    in_raster, nodata_value = _shrink_integer_raster(in_raster, nodata_value)
+    func = _RASTER_TO_H3_FUNCS.get((in_raster.dtype.kind, in_raster.dtype.itemsize))
+    if func is None:
+        raise NotImplementedError(f"no raster_to_h3 implementation for dtype {value_dtype.name}")
 
     values, indexes = func(in_raster, _get_transform(transform), nodata_value, h3_resolution, axis_order, compacted)
+    if values.dtype != value_dtype:
+        # restore the dtype the caller passed in
+        values = values.astype(value_dtype)
     if geo:
         return gp.GeoDataFrame({
             "h3index": indexes,
             "value": values,
-            "geometry": [Polygon(h3.h3_to_geo_boundary(h, geo_json=True)) for h in _array_nditer(indexes)],
+            "geometry": _h3indexes_to_polygons(indexes),
         }, crs=H3_CRS)
     else:
         return pd.DataFrame({
@@ -115,7 +181,7 @@ def raster_to_geodataframe(*a, **kw):
     """
     convert to a geodataframe
 
-    Uses the same parameters as array_to_dataframe
+    Uses the same parameters as raster_to_dataframe
     """
     kw["geo"] = True
     return raster_to_dataframe(*a, **kw)
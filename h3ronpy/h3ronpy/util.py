@@ -2,24 +2,79 @@ import warnings
 from typing import Union, List, Iterable
 
 import geopandas as gpd
-import h3.api.numpy_int as h3
 import numpy as np
 import pandas as pd
-from shapely.geometry import Polygon
+from shapely import linearrings, polygons
 
 from . import H3_CRS
 
+try:
+    from .h3ronpy import cell_boundaries, cell_geodataframe_parts
+except ImportError:
+    # compiled extension predating these helpers. fall back to collecting
+    # the boundaries via h3-py.
+    cell_boundaries = None
+    cell_geodataframe_parts = None
+
+
+def _ring_polygons(coords: np.array, ring_lengths: np.array) -> np.array:
+    """build shapely polygons from a coordinate buffer and the ring lengths"""
+    # np.repeat requires the repeats to be safely castable to np.intp, which
+    # the uint64 ring lengths are not
+    ring_lengths = ring_lengths.astype(np.intp, copy=False)
+    return polygons(linearrings(coords, indices=np.repeat(np.arange(len(ring_lengths)), ring_lengths)))
+
+
+def _cell_boundaries_py(i_arr: np.array):
+    """
+    pure-python variant of the cell_boundaries extension function
+
+    Collects the boundaries via h3-py. Far slower than the rust
+    implementation, but keeps this module working against older builds of
+    the compiled extension.
+    """
+    import h3.api.numpy_int as h3
+    boundaries = [h3.h3_to_geo_boundary(h, geo_json=True) for h in i_arr.tolist()]
+    ring_lengths = np.fromiter((len(b) for b in boundaries), dtype=np.intp, count=len(boundaries))
+    coords = np.concatenate(boundaries).astype(np.float64, copy=False).reshape(-1, 2)
+    return coords, ring_lengths
+
+
+def _h3indexes_to_polygons(h3indexes: np.array) -> np.array:
+    """
+    convert an array of h3indexes to a numpy array of shapely polygons
+
+    The boundary coordinates of all cells are collected in rust in a single
+    call and passed to shapely's vectorized geometry constructors. This avoids
+    both one FFI round-trip and one python ``Polygon`` object per cell.
+    """
+    i_arr = np.ascontiguousarray(h3indexes, dtype=np.uint64)
+    if i_arr.size == 0:
+        return np.array([], dtype=object)
+    coords, ring_lengths = (cell_boundaries or _cell_boundaries_py)(i_arr)
+    return _ring_polygons(coords, ring_lengths)
+
 
 def h3indexes_to_geodataframe(
         h3indexes: Union[np.array, List[int], Iterable[int]]) -> gpd.GeoDataFrame:
     """
     convert a numpy-array with uint64 h3 indexes to a geodataframe
     """
-    i_arr = np.asarray(h3indexes)
+    i_arr = np.ascontiguousarray(h3indexes, dtype=np.uint64)
+    if i_arr.size == 0:
+        geometry, resolutions = np.array([], dtype=object), np.array([], dtype=np.uint8)
+    elif cell_geodataframe_parts is not None:
+        # fused rust call collecting boundaries and resolutions in one pass
+        coords, ring_lengths, resolutions = cell_geodataframe_parts(i_arr)
+        geometry = _ring_polygons(coords, ring_lengths)
+    else:
+        geometry = _ring_polygons(*_cell_boundaries_py(i_arr))
+        # the resolution is stored in bits 52-55 of the h3index
+        resolutions = ((i_arr >> np.uint64(52)) & np.uint64(0xF)).astype(np.uint8)
     return gpd.GeoDataFrame({
-        "geometry": [Polygon(h3.h3_to_geo_boundary(h, geo_json=True)) for h in _array_nditer(i_arr)],
-        "h3resolution": [h3.h3_get_resolution(h) for h in _array_nditer(i_arr)],
-        "h3index": [h3.h3_to_string(h) for h in _array_nditer(i_arr)]
+        "geometry": geometry,
+        "h3resolution": resolutions,
+        "h3index": np.char.mod("%x", i_arr)
     }, crs=H3_CRS)
 
 
@@ -45,10 +100,5 @@ def dataframe_to_geodataframe(df: pd.DataFrame, column_name: str = "h3index") ->
     :return: GeoDataFrame
     """
     return gpd.GeoDataFrame(df,
-                            geometry=[Polygon(h3.h3_to_geo_boundary(h, geo_json=True)) for h in
-                                      _array_nditer(df[column_name].to_numpy())],
+                            geometry=_h3indexes_to_polygons(df[column_name].to_numpy()),
                             crs=H3_CRS)
-
-
-def _array_nditer(a: np.array):
-    return np.nditer(a, flags=["zerosize_ok", ])
@@ -1,9 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Generator
 
 import geopandas as gpd
-import math
 import numpy as np
 import pandas as pd
+from shapely import to_wkb
 
 from .h3ronpy import vector
 
@@ -23,13 +24,46 @@ def geometries_to_h3_generator(geometries: np.array, ids: np.array, h3_resolutio
     :param chunk_size: Number of geometries to include in the yielded chunks
     :return: None
     """
-    num_chunks = math.ceil(len(geometries) / chunk_size)
-    for (chunk_geometries, chunk_ids) in zip(np.array_split(geometries, num_chunks),
-                                             np.array_split(ids, num_chunks)):
-        chunk_wkb_list = [item.wkb for item in chunk_geometries]
+    # plain slicing instead of np.array_split, so geometry arrays of
+    # geodataframes can be chunked without converting them to object arrays
+    chunks = ((geometries[chunk_start:(chunk_start + chunk_size)], ids[chunk_start:(chunk_start + chunk_size)])
+              for chunk_start in range(0, len(geometries), chunk_size))
 
-        (ids, h3indexes) = vector.wkbbytes_with_ids_to_h3(chunk_ids, chunk_wkb_list, h3_resolution, do_compact)
-        yield ids, h3indexes
+    # serialize one chunk ahead in a worker thread. the rust conversion
+    # releases the GIL, so the WKB serialization of the next chunk overlaps
+    # with the h3 computation of the current one.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = None
+        for (chunk_geometries, chunk_ids) in chunks:
+            submitted = (chunk_ids, executor.submit(_chunk_to_wkb_buffer, chunk_geometries))
+            if pending is not None:
+                yield _convert_wkb_chunk(pending, h3_resolution, do_compact)
+            pending = submitted
+        if pending is not None:
+            yield _convert_wkb_chunk(pending, h3_resolution, do_compact)
+
+
+def _convert_wkb_chunk(pending, h3_resolution: int, do_compact: bool) -> Tuple[np.array, np.array]:
+    """convert a (ids, wkb-buffer-future) tuple to h3indexes"""
+    chunk_ids, wkb_future = pending
+    wkb_buffer, wkb_offsets = wkb_future.result()
+    return vector.wkbbuffer_with_ids_to_h3(chunk_ids, wkb_buffer, wkb_offsets, h3_resolution, do_compact)
+
+
+def _chunk_to_wkb_buffer(chunk_geometries: np.array) -> Tuple[np.array, np.array]:
+    """
+    serialize the geometries of a chunk into a single concatenated WKB buffer
+
+    Returns the buffer and the offsets of the geometries within it. Passing one
+    buffer avoids creating and converting a python bytes-instance per geometry
+    at the FFI boundary.
+    """
+    # serialize the whole chunk at once with shapely's vectorized to_wkb
+    chunk_wkb = to_wkb(chunk_geometries)
+    lengths = np.fromiter((len(wkb) for wkb in chunk_wkb), dtype=np.uint64, count=len(chunk_wkb))
+    wkb_offsets = np.concatenate((np.zeros(1, dtype=np.uint64), np.cumsum(lengths, dtype=np.uint64)))
+    wkb_buffer = np.frombuffer(b"".join(chunk_wkb), dtype=np.uint8)
+    return wkb_buffer, wkb_offsets
 
 
 def geodataframe_to_h3(df: gpd.GeoDataFrame, h3_resolution: int, do_compact: bool = False, geometry_column="geometry",
@@ -46,15 +80,17 @@ def geodataframe_to_h3(df: gpd.GeoDataFrame, h3_resolution: int, do_compact: boo
     :param do_compact: Compacts the h3index when this is set to `True`. Default is `False`
     :param geometry_column: The name of the column containing the geometry. Defaults to `geometry`.
     :param index_column_name: The name for a temporary column used to join the H3 data to the input dataframe
-    :param chunk_size:
+    :param chunk_size: Number of geometries to convert in one go
     :return:
     """
-    # add a column with a sequence to merge later with
-    df.insert(loc=0, column=index_column_name, value=np.arange(len(df), dtype=np.uint64))
+    # positional sequence to merge later with. kept out of the input dataframe
+    # to not mutate the frame of the caller.
+    row_ids = np.arange(len(df), dtype=np.uint64)
     dataframes = []
-    for (ids, h3indexes) in geometries_to_h3_generator(df[geometry_column].to_numpy(), df[index_column_name].to_numpy(),
+    # .array accesses the geometry column without copying it into an object array
+    for (ids, h3indexes) in geometries_to_h3_generator(df[geometry_column].array, row_ids,
                                                        h3_resolution,
-                                                       do_compact=do_compact, chunk_size=1000):
+                                                       do_compact=do_compact, chunk_size=chunk_size):
         dataframes.append(pd.DataFrame({
             index_column_name: ids,
             "h3index": h3indexes
@@ -62,10 +98,14 @@ def geodataframe_to_h3(df: gpd.GeoDataFrame, h3_resolution: int, do_compact: boo
 
     if not dataframes:
         return pd.DataFrame({})
-    output_df = pd.DataFrame(df.drop(columns=geometry_column)) \
-        .merge(pd.concat(dataframes), on=index_column_name)
+    h3_df = pd.concat(dataframes, ignore_index=True)
 
-    # remove the column used for the merge again
-    del output_df[index_column_name]
+    # the ids are the positions of the rows in the input dataframe, so the
+    # attribute columns can be gathered with a positional take instead of a
+    # hash-based merge
+    output_df = pd.DataFrame(df.drop(columns=geometry_column)) \
+        .take(h3_df[index_column_name].to_numpy().astype(np.intp)) \
+        .reset_index(drop=True)
+    output_df["h3index"] = h3_df["h3index"].to_numpy()
 
     return output_df
@@ -1,5 +1,6 @@
 use pyo3::{prelude::*, wrap_pyfunction, PyNativeType, Python};
 
+use crate::polygon::init_polygon_functions;
 use crate::raster::init_raster_submodule;
 use crate::vector::init_vector_submodule;
 use crate::{collections::H3CompactedVec, polygon::Polygon};
@@ -26,6 +27,7 @@ fn h3ronpy(py: Python<'_>, m: &PyModule) -> PyResult<()> {
     m.add("Polygon", m.py().get_type::<Polygon>())?;
 
     m.add_function(wrap_pyfunction!(version, m)?)?;
+    init_polygon_functions(m)?;
 
     let vector_submod = PyModule::new(py, "vector")?;
     init_vector_submodule(vector_submod)?;
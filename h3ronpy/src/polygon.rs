@@ -2,11 +2,13 @@ use std::collections::HashMap;
 use std::iter::once;
 
 use geo_types as gt;
-use numpy::PyReadonlyArray1;
-use pyo3::prelude::*;
+use ndarray::Array2;
+use numpy::{IntoPyArray, Ix1, Ix2, PyArray, PyReadonlyArray1};
 use pyo3::types::PyTuple;
+use pyo3::{prelude::*, wrap_pyfunction};
+use rayon::prelude::*;
 
-use h3ron::{H3Cell, Index, ToAlignedLinkedPolygons, ToLinkedPolygons};
+use h3ron::{H3Cell, Index, ToAlignedLinkedPolygons, ToLinkedPolygons, ToPolygon};
 
 #[pyclass]
 pub struct Polygon {
@@ -74,3 +76,108 @@ impl Polygon {
         main.to_object(py)
     }
 }
+
+/// the boundary ring of a cell as interleaved (x, y) coordinates
+fn boundary_ring(h3index: u64) -> Vec<f64> {
+    let poly = H3Cell::new(h3index).to_polygon();
+    let ring = poly.exterior();
+    let mut coords = Vec::with_capacity(ring.0.len() * 2);
+    for c in ring.0.iter() {
+        coords.push(c.x);
+        coords.push(c.y);
+    }
+    coords
+}
+
+/// collect the boundary coordinates of the given cells
+///
+/// The boundary rings of all cells are written consecutively into a single
+/// `(num_coordinates, 2)` array in (x, y) order. As the number of boundary
+/// vertices differs between cells - pentagons and cells distorted by
+/// icosahedron edges - the length of each ring is returned in a second array.
+///
+/// The boundary computation runs in parallel in rust with the GIL released,
+/// matching the multi-core behavior of the raster and vector conversions.
+#[allow(clippy::type_complexity)]
+#[pyfunction]
+pub fn cell_boundaries(
+    py: Python,
+    h3index_arr: PyReadonlyArray1<u64>,
+) -> PyResult<(Py<PyArray<f64, Ix2>>, Py<PyArray<u64, Ix1>>)> {
+    let cells = h3index_arr.as_slice()?;
+    let (coords, ring_lengths) = py.allow_threads(|| {
+        let rings: Vec<_> = cells
+            .par_iter()
+            .map(|h3index| boundary_ring(*h3index))
+            .collect();
+
+        // 7 vertices (closed ring) for plain hexagons
+        let mut coords = Vec::with_capacity(cells.len() * 7 * 2);
+        let mut ring_lengths = Vec::with_capacity(cells.len());
+        for mut ring in rings {
+            ring_lengths.push((ring.len() / 2) as u64);
+            coords.append(&mut ring);
+        }
+        (coords, ring_lengths)
+    });
+    let num_coordinates = coords.len() / 2;
+    Ok((
+        Array2::from_shape_vec((num_coordinates, 2), coords)
+            .expect("coordinate buffer with invalid shape")
+            .into_pyarray(py)
+            .to_owned(),
+        ring_lengths.into_pyarray(py).to_owned(),
+    ))
+}
+
+/// collect the boundary coordinates and resolutions of the given cells
+///
+/// Fused variant of `cell_boundaries` computing everything needed for
+/// building a geodataframe from a cell array in a single parallel pass,
+/// instead of iterating the cells once per column.
+#[allow(clippy::type_complexity)]
+#[pyfunction]
+pub fn cell_geodataframe_parts(
+    py: Python,
+    h3index_arr: PyReadonlyArray1<u64>,
+) -> PyResult<(
+    Py<PyArray<f64, Ix2>>,
+    Py<PyArray<u64, Ix1>>,
+    Py<PyArray<u8, Ix1>>,
+)> {
+    let cells = h3index_arr.as_slice()?;
+    let (coords, ring_lengths, resolutions) = py.allow_threads(|| {
+        let rings: Vec<_> = cells
+            .par_iter()
+            .map(|h3index| {
+                let cell = H3Cell::new(*h3index);
+                (boundary_ring(cell.h3index()), cell.resolution())
+            })
+            .collect();
+
+        let mut coords = Vec::with_capacity(cells.len() * 7 * 2);
+        let mut ring_lengths = Vec::with_capacity(cells.len());
+        let mut resolutions = Vec::with_capacity(cells.len());
+        for (mut ring, resolution) in rings {
+            ring_lengths.push((ring.len() / 2) as u64);
+            coords.append(&mut ring);
+            resolutions.push(resolution);
+        }
+        (coords, ring_lengths, resolutions)
+    });
+    let num_coordinates = coords.len() / 2;
+    Ok((
+        Array2::from_shape_vec((num_coordinates, 2), coords)
+            .expect("coordinate buffer with invalid shape")
+            .into_pyarray(py)
+            .to_owned(),
+        ring_lengths.into_pyarray(py).to_owned(),
+        resolutions.into_pyarray(py).to_owned(),
+    ))
+}
+
+pub fn init_polygon_functions(m: &PyModule) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(cell_boundaries, m)?)?;
+    m.add_function(wrap_pyfunction!(cell_geodataframe_parts, m)?)?;
+    Ok(())
+}
@@ -99,16 +99,15 @@ where
         .into_pyresult()?
         .drain()
     {
-        let mut this_indexes: Vec<_> = if compacted {
-            compacted_vec.iter_compacted_indexes().collect()
+        // stream the indexes directly into the output vec without collecting
+        // them into intermediate allocations first
+        let len_before = h3indexes.len();
+        if compacted {
+            h3indexes.extend(compacted_vec.iter_compacted_indexes());
         } else {
-            compacted_vec
-                .iter_uncompacted_indexes(h3_resolution)
-                .collect()
-        };
-        let mut this_values = vec![*value; this_indexes.len()];
-        values.append(&mut this_values);
-        h3indexes.append(&mut this_indexes);
+            h3indexes.extend(compacted_vec.iter_uncompacted_indexes(h3_resolution));
+        }
+        values.resize(values.len() + (h3indexes.len() - len_before), *value);
     }
 
     Ok((values, h3indexes))
@@ -127,14 +126,16 @@ macro_rules! make_raster_to_h3_variant {
             compacted: bool,
         ) -> PyResult<(Py<PyArray<$dtype, Ix1>>, Py<PyArray<u64, Ix1>>)> {
             let arr = np_array.as_array();
-            raster_to_h3(
-                &arr,
-                transform,
-                &nodata_value,
-                h3_resolution,
-                axis_order_str,
-                compacted,
-            )
+            py.allow_threads(|| {
+                raster_to_h3(
+                    &arr,
+                    transform,
+                    &nodata_value,
+                    h3_resolution,
+                    axis_order_str,
+                    compacted,
+                )
+            })
             .map(|(values, h3indexes)| {
                 (
                     values.into_pyarray(py).to_owned(),
@@ -159,17 +160,19 @@ macro_rules! make_raster_to_h3_float_variant {
         ) -> PyResult<(Py<PyArray<$dtype, Ix1>>, Py<PyArray<u64, Ix1>>)> {
             {
                 let arr = np_array.as_array();
-                // create a copy with the values wrapped in ordered floats to
-                // support the internal hashing
-                let of_arr = arr.map(|v| OrderedFloat::from(*v));
-                raster_to_h3(
-                    &of_arr.view(),
-                    transform,
-                    &nodata_value.map(OrderedFloat::from),
-                    h3_resolution,
-                    axis_order_str,
-                    compacted,
-                )
+                py.allow_threads(|| {
+                    // create a copy with the values wrapped in ordered floats to
+                    // support the internal hashing
+                    let of_arr = arr.map(|v| OrderedFloat::from(*v));
+                    raster_to_h3(
+                        &of_arr.view(),
+                        transform,
+                        &nodata_value.map(OrderedFloat::from),
+                        h3_resolution,
+                        axis_order_str,
+                        compacted,
+                    )
+                })
             }
             .map(|(mut values, h3indexes)| {
                 let float_vec: Vec<_> = values.drain(..).map(|v| *v).collect();
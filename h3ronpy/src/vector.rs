@@ -9,7 +9,7 @@ use h3ron::{compact, Index, ToH3Indexes};
 
 use crate::error::IntoPyResult;
 
-fn wkbbytes_to_h3(wkbdata: &&[u8], h3_resolution: u8, do_compact: bool) -> PyResult<Vec<u64>> {
+fn wkbbytes_to_h3(wkbdata: &[u8], h3_resolution: u8, do_compact: bool) -> PyResult<Vec<u64>> {
     let mut cursor = Cursor::new(wkbdata);
     match wkb::wkb_to_geom(&mut cursor) {
         Ok(g) => {
@@ -30,52 +30,62 @@ fn wkbbytes_to_h3(wkbdata: &&[u8], h3_resolution: u8, do_compact: bool) -> PyRes
     }
 }
 
+/// convert the WKB geometries in the given buffer to h3indexes
+///
+/// The WKBs are passed as one concatenated buffer plus an offsets array of
+/// length `len(ids) + 1` marking the start of each geometry. This avoids
+/// converting a python list of bytes-instances - one object per geometry -
+/// at the FFI boundary.
 #[allow(clippy::type_complexity)]
 #[pyfunction]
-fn wkbbytes_with_ids_to_h3(
+fn wkbbuffer_with_ids_to_h3(
     py: Python,
     id_array: PyReadonlyArray1<u64>,
-    wkb_list: Vec<&[u8]>,
+    wkb_buffer: PyReadonlyArray1<u8>,
+    wkb_offsets: PyReadonlyArray1<u64>,
     h3_resolution: u8,
     do_compact: bool,
 ) -> PyResult<(Py<PyArray<u64, Ix1>>, Py<PyArray<u64, Ix1>>)> {
-    // the solution with the argument typed as list of byte-instances is not great. This
-    // maybe can be improved with https://github.com/PyO3/rust-numpy/issues/175
+    let ids = id_array.as_slice()?;
+    let buffer = wkb_buffer.as_slice()?;
+    let offsets = wkb_offsets.as_slice()?;
 
-    if id_array.len() != wkb_list.len() {
+    if offsets.len() != ids.len() + 1 {
         return Err(PyValueError::new_err(
-            "input Ids and WKBs must be of the same length",
+            "WKB offsets must be one element longer than the input Ids",
         ));
     }
-    let out = id_array
-        .as_array()
-        .iter()
-        .zip(wkb_list.iter())
-        .par_bridge()
-        .map(|(id, wkbdata)| {
-            wkbbytes_to_h3(wkbdata, h3_resolution, do_compact).map(|h3indexes| (*id, h3indexes))
-        })
-        .try_fold(
-            || (vec![], vec![]),
-            |mut a, b| match b {
-                Ok((id, mut indexes)) => {
-                    for _ in 0..indexes.len() {
-                        a.0.push(id);
+    // with the GIL released the python side can serialize the next chunk
+    // concurrently
+    let out = py.allow_threads(|| {
+        ids.par_iter()
+            .zip(offsets.par_windows(2))
+            .map(|(id, window)| {
+                let wkbdata = buffer
+                    .get((window[0] as usize)..(window[1] as usize))
+                    .ok_or_else(|| PyValueError::new_err("invalid WKB offsets"))?;
+                wkbbytes_to_h3(wkbdata, h3_resolution, do_compact).map(|h3indexes| (*id, h3indexes))
+            })
+            .try_fold(
+                || (vec![], vec![]),
+                |mut a, b| match b {
+                    Ok((id, mut indexes)) => {
+                        a.0.resize(a.0.len() + indexes.len(), id);
+                        a.1.append(&mut indexes);
+                        Ok(a)
                     }
-                    a.1.append(&mut indexes);
-                    Ok(a)
-                }
-                Err(err) => Err(err),
-            },
-        )
-        .try_reduce(
-            || (vec![], vec![]),
-            |mut a, mut b| {
-                b.0.append(&mut a.0);
-                b.1.append(&mut a.1);
-                Ok(b)
-            },
-        )?;
+                    Err(err) => Err(err),
+                },
+            )
+            .try_reduce(
+                || (vec![], vec![]),
+                |mut a, mut b| {
+                    b.0.append(&mut a.0);
+                    b.1.append(&mut a.1);
+                    Ok(b)
+                },
+            )
+    })?;
 
     Ok((
         out.0.into_pyarray(py).to_owned(),
@@ -84,6 +94,6 @@ fn wkbbytes_with_ids_to_h3(
 }
 
 pub fn init_vector_submodule(m: &PyModule) -> PyResult<()> {
-    m.add_function(wrap_pyfunction!(wkbbytes_with_ids_to_h3, m)?)?;
+    m.add_function(wrap_pyfunction!(wkbbuffer_with_ids_to_h3, m)?)?;
     Ok(())
 }
@@ -1,3 +1,4 @@
+import pytest
 import rasterio
 import numpy as np
 
@@ -15,6 +16,22 @@ def test_r_tiff():
     assert df.dtypes["value"] == "uint8"
 
 
+def test_r_tiff_int32_float_nodata():
+    dataset = rasterio.open(TESTDATA_PATH / "r.tiff")
+    band = dataset.read(1).astype(np.int32)
+    # an integral float nodata value - as rasterio returns them - must lead
+    # to the same result as its integer equivalent
+    df_float_nodata = raster_to_dataframe(band, dataset.transform, 8, nodata_value=0.0, compacted=True, geo=False)
+    df_int_nodata = raster_to_dataframe(band, dataset.transform, 8, nodata_value=0, compacted=True, geo=False)
+    assert len(df_float_nodata) == len(df_int_nodata)
+    assert df_float_nodata.dtypes["value"] == "int32"
+
+    # a non-integral nodata value can not be represented in any integer dtype
+    # and must not be silently truncated by the dtype shrinking
+    with pytest.raises(TypeError):
+        raster_to_dataframe(band, dataset.transform, 8, nodata_value=0.5, compacted=True, geo=False)
+
+
 def test_r_tiff_float32():
     dataset = rasterio.open(TESTDATA_PATH / "r.tiff")
     band = dataset.read(1).astype(np.float32)
@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 
-from h3ronpy.util import dataframe_to_geodataframe
+from h3ronpy import util
+from h3ronpy.util import dataframe_to_geodataframe, h3indexes_to_geodataframe
 
 
 def test_empty_to_geo():
@@ -8,3 +10,28 @@ def test_empty_to_geo():
     df = pd.DataFrame({"h3index": []})
     gdf = dataframe_to_geodataframe(df)  # should not raise an ValueError.
     assert gdf.empty
+
+
+def test_non_empty_to_geo():
+    df = pd.DataFrame({"h3index": np.array([0x8928308280fffff], dtype=np.uint64)})
+    gdf = dataframe_to_geodataframe(df)
+    assert len(gdf) == 1
+    assert gdf.geometry[0].is_valid
+
+
+def test_h3indexes_to_geodataframe():
+    gdf = h3indexes_to_geodataframe(np.array([0x8928308280fffff], dtype=np.uint64))
+    assert len(gdf) == 1
+    assert gdf.geometry[0].is_valid
+    assert gdf["h3resolution"][0] == 9
+    assert gdf["h3index"][0] == "8928308280fffff"
+
+
+def test_h3indexes_to_geodataframe_h3py_fallback(monkeypatch):
+    # simulate a compiled extension predating the boundary helpers
+    monkeypatch.setattr(util, "cell_boundaries", None)
+    monkeypatch.setattr(util, "cell_geodataframe_parts", None)
+    gdf = h3indexes_to_geodataframe(np.array([0x8928308280fffff], dtype=np.uint64))
+    assert len(gdf) == 1
+    assert gdf.geometry[0].is_valid
+    assert gdf["h3resolution"][0] == 9
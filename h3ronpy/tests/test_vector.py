@@ -8,3 +8,17 @@ def test_geodataframe_to_h3():
     df = geodataframe_to_h3(africa, 4)
     assert len(df) > 1000
     assert df.dtypes["h3index"] == "uint64"
+
+
+def test_geodataframe_to_h3_chunked():
+    world = gpd.read_file(gpd.datasets.get_path('naturalearth_lowres'))
+    africa = world[world["continent"] == "Africa"]
+    df_single_chunk = geodataframe_to_h3(africa, 4)
+    # small chunk_size to force many chunks through the prefetch pipeline
+    df_chunked = geodataframe_to_h3(africa, 4, chunk_size=7)
+    assert len(df_chunked) == len(df_single_chunk)
+
+    # the rows must be identical regardless of the chunking, the ordering may differ
+    sort_by = ["h3index", "name"]
+    assert df_single_chunk.sort_values(sort_by).reset_index(drop=True) \
+        .equals(df_chunked.sort_values(sort_by).reset_index(drop=True))